@@ -1,39 +1,127 @@
 #!/usr/bin/env python3
 """
-Ingest WHO GHO API indicator data into local raw files (JSONL).
+Ingest WHO GHO API indicator data into local raw files (gzipped JSONL).
 
 Writes:
-  data/raw/who/<indicator_code>/ingest_date=YYYY-MM-DD/part-00000.jsonl
+  data/raw/who/<indicator_code>/ingest_date=YYYY-MM-DD/part-00000.jsonl.gz
 
 Why JSONL?
 - Append-friendly
-- Great for DuckDB read_json_auto()
+- Great for DuckDB read_json_auto() (reads .gz transparently)
 - Keeps each record intact (bronze/raw layer)
 
 Example:
   python scripts/ingest_who.py --indicator MDG_0000000007
   python scripts/ingest_who.py --indicator MDG_0000000007 --top 5000
+  python scripts/ingest_who.py --indicator MDG_0000000007,WHOSIS_000001
 """
 
 from __future__ import annotations
 
 import argparse
+import asyncio
+import collections
+import contextlib
+import functools
+import gzip
 import json
+import logging
 import os
+import queue
+import random
 import sys
+import threading
 import time
+import uuid
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 from urllib.parse import urlencode
 
+import aiohttp
+import ijson
+import orjson
+import pyarrow as pa
+import pyarrow.parquet as pq
 import requests
-import snowflake.connector
 from dotenv import load_dotenv
+from pyarrow import json as pa_json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+if TYPE_CHECKING:
+    import snowflake.connector
 
 
 GHO_BASE = "https://ghoapi.azureedge.net/api"
 
+# requests and aiohttp only decode br when a brotli module is importable.
+try:
+    import brotli  # noqa: F401
+
+    ACCEPT_ENCODING = "gzip, br"
+except ImportError:
+    ACCEPT_ENCODING = "gzip"
+
+log = logging.getLogger("ingest_who")
+
+# TokenBucket never slows below this after repeated 429s.
+MIN_RATE_RPS = 0.5
+
+# --max-page-size-probe starts here and halves down to --page-size, but only
+# on statuses that mean the request itself was too large.
+PROBE_START_PAGE_SIZE = 10000
+PAGE_SIZE_REJECTED_STATUSES = (400, 413, 414)
+
+# Transient WHO API statuses retried with exponential backoff (Retry-After wins when sent).
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+MAX_RETRIES = 8
+RETRY_BACKOFF_BASE_S = 0.5
+RETRY_BACKOFF_CAP_S = 30.0
+
+# Snowflake caps bind parameters per statement; each inserted row binds 4.
+SNOWFLAKE_MAX_BIND_PARAMS = 16384
+SNOWFLAKE_LOAD_METHODS = ("copy", "insert", "pandas")
+# COPY FILE_FORMAT per staged file type; both are already compressed locally.
+STAGE_FILE_FORMATS = {
+    "parquet": "TYPE = PARQUET",
+    "jsonl": "TYPE = JSON COMPRESSION = GZIP STRIP_OUTER_ARRAY = FALSE",
+}
+# Max INSERT batches buffered ahead of the Snowflake writer thread.
+SNOWFLAKE_WRITER_QUEUE_SIZE = 4
+# Rows per write_pandas DataFrame; one such chunk is buffered ahead of the writer thread.
+PANDAS_CHUNK_ROWS = 100_000
+# write_pandas upload tuning: rows per staged Parquet file and concurrent PUT threads.
+PANDAS_FILE_ROWS = 16_000
+PANDAS_PUT_PARALLEL = 8
+
+# Read size for stream-parsing WHO API responses in the serial path.
+READ_BUFFER_BYTES = 64 << 10
+# JSONL rows are staged in memory and handed to gzip in chunks of this size.
+FLUSH_BYTES = 16 << 20
+# gzip level 1 compresses near line rate; higher levels cost CPU for little gain on JSONL.
+JSONL_GZIP_LEVEL = 1
+
+# Queue sentinels between the async fetchers and the (threaded) file writer.
+_DONE = object()
+_ABORT = object()
+
+
+class WHOAPIError(RuntimeError):
+    """
+    Non-200 response from the WHO API (after any retries).
+    """
+
+    def __init__(self, status: int, body: str) -> None:
+        super().__init__(f"HTTP {status} from WHO API:\n{body[:500]}")
+        self.status = status
+        self.body = body[:500]
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Keeps the error picklable across process-pool workers.
+        return type(self), (self.status, self.body)
+
 
 def utc_today_str() -> str:
     return datetime.now(timezone.utc).date().isoformat()
@@ -44,46 +132,142 @@ def project_root_from_this_file() -> Path:
     return Path(__file__).resolve().parent.parent
 
 
-def build_url(
+class TokenBucket:
+    """
+    Adaptive token-bucket limiter for WHO API requests: `rate` per second,
+    bursts of up to `burst`; observe() adapts the rate to responses.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.ceiling = rate
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+
+    def _take(self) -> float:
+        """
+        Takes one token and returns how long to wait until it is actually available.
+        """
+        now = time.monotonic()
+        self._tokens = min(float(self.burst), self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+        return max(0.0, -self._tokens / self.rate)
+
+    async def acquire(self) -> None:
+        # Created lazily so the lock binds to the running event loop.
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            await asyncio.sleep(self._take())
+
+    def acquire_blocking(self) -> None:
+        time.sleep(self._take())
+
+    def observe(self, status: int, headers: Any) -> None:
+        """
+        Adapts the rate to a response's status and rate-limit headers.
+        """
+        if status == 429 or headers.get("X-RateLimit-Remaining") == "0":
+            self.rate = max(MIN_RATE_RPS, self.rate / 2)
+        elif status == 200:
+            self.rate = min(self.ceiling, self.rate * 1.05)
+
+
+def build_http_session(headers: Dict[str, str], *, pool_maxsize: int) -> requests.Session:
+    """
+    One keep-alive session for the whole run; the adapter only retries
+    connection and read errors (status retries are in get_with_retries).
+    """
+    session = requests.Session()
+    session.headers.update(headers)
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(
+            total=MAX_RETRIES,
+            status=0,
+            backoff_factor=RETRY_BACKOFF_BASE_S,
+            backoff_max=RETRY_BACKOFF_CAP_S,
+            respect_retry_after_header=False,
+            allowed_methods=["GET"],
+        ),
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+def build_base_url(
     indicator: str,
-    skip: int = 0,
-    top: int = 1000,
     select: Optional[str] = None,
     filters: Optional[str] = None,
 ) -> str:
     """
-    WHO GHO OData pagination uses $top and $skip.
+    The constant part of every page URL for one run, encoded once.
     """
-    endpoint = f"{GHO_BASE}/{indicator}"
-
-    params = {
-        "$format": "json",
-        "$top": str(top),
-        "$skip": str(skip),
-    }
+    params = {"$format": "json"}
     if select:
         params["$select"] = select
     if filters:
         params["$filter"] = filters
 
-    return endpoint + "?" + urlencode(params)
+    return f"{GHO_BASE}/{indicator}?{urlencode(params, safe='$')}"
+
+
+def page_url(base_url: str, *, skip: int, top: int, count: bool = False) -> str:
+    """
+    WHO GHO OData pagination uses $top and $skip.
+    count=True also asks for the total row count (@odata.count).
+    """
+    if count:
+        return f"{base_url}&$top={top}&$skip={skip}&$count=true"
+    return f"{base_url}&$top={top}&$skip={skip}"
 
 
 def iter_pages(
-    indicator: str,
+    base_url: str,
     *,
     session: requests.Session,
     page_size: int,
     max_rows: Optional[int],
-    select: Optional[str],
-    filters: Optional[str],
-    sleep_s: float,
+    bucket: Optional[TokenBucket],
     timeout_s: int,
+    cache: Optional[PageCache] = None,
 ) -> Iterable[Dict[str, Any]]:
     """
-    Yields records across paginated responses.
+    Yields records across paginated responses, stream-parsed as they arrive.
     Stops when API returns empty page or reaches max_rows.
     """
+    if not isinstance(session, requests.Session):
+        raise TypeError("iter_pages requires a shared requests.Session")
+
+    try:
+        yield from _iter_pages(
+            base_url,
+            session=session,
+            page_size=page_size,
+            max_rows=max_rows,
+            bucket=bucket,
+            timeout_s=timeout_s,
+            cache=cache,
+        )
+    finally:
+        if cache is not None:
+            cache.close()
+
+
+def _iter_pages(
+    base_url: str,
+    *,
+    session: requests.Session,
+    page_size: int,
+    max_rows: Optional[int],
+    bucket: Optional[TokenBucket],
+    timeout_s: int,
+    cache: Optional[PageCache],
+) -> Iterable[Dict[str, Any]]:
     fetched = 0
     skip = 0
 
@@ -96,38 +280,449 @@ def iter_pages(
                 return
             top = min(top, remaining)
 
-        url = build_url(indicator, skip=skip, top=top, select=select, filters=filters)
-        resp = session.get(url, timeout=timeout_s)
-        if resp.status_code != 200:
-            raise RuntimeError(f"HTTP {resp.status_code} from WHO API:\n{resp.text[:500]}")
+        url = page_url(base_url, skip=skip, top=top)
+        etag = cache.etag(url) if cache is not None else None
+        with get_with_retries(
+            session, url, headers={"If-None-Match": etag} if etag else None, bucket=bucket, timeout_s=timeout_s
+        ) as resp:
+            if resp.status_code == 304 and cache is not None:
+                log.debug("GET %s -> 304; replaying previous rows", url)
+                rows = cache.replay(url, skip)
+                yield from rows
+                count = len(rows)
+            elif resp.status_code != 200:
+                raise WHOAPIError(resp.status_code, resp.text)
+            else:
+                log.debug(
+                    "GET %s -> 200 (Content-Encoding: %s)", url, resp.headers.get("Content-Encoding", "identity")
+                )
+
+                # Stream-parse the page so memory stays flat at any page size;
+                # decode_content lets urllib3 un-gzip the raw stream for ijson.
+                resp.raw.decode_content = True
+                count = 0
+                for r in ijson.items(resp.raw, "value.item", use_float=True, buf_size=READ_BUFFER_BYTES):
+                    yield r
+                    count += 1
+                if cache is not None:
+                    cache.store(url, resp.headers.get("ETag"), count)
+
+        if count == 0:
+            return
+        fetched += count
+        skip += count
+
+
+def retry_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """
+    Seconds to wait before retry number `attempt` (0-based): the server's
+    Retry-After when it is given in seconds, else jittered exponential backoff.
+    """
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass  # HTTP-date form; fall back to backoff
+    return min(RETRY_BACKOFF_CAP_S, RETRY_BACKOFF_BASE_S * 2**attempt) + random.random() * 0.1
+
+
+def get_with_retries(
+    session: requests.Session,
+    url: str,
+    *,
+    headers: Optional[Dict[str, str]],
+    bucket: Optional[TokenBucket],
+    timeout_s: int,
+) -> requests.Response:
+    """
+    Streaming GET for the serial path. Every attempt first takes a token from
+    `bucket` (when given) and reports its status to it; 429/5xx responses are
+    retried up to MAX_RETRIES times. Returns the last response, whatever its status.
+    """
+    attempt = 0
+    while True:
+        if bucket is not None:
+            bucket.acquire_blocking()
+        resp = session.get(url, headers=headers, stream=True, timeout=timeout_s)
+        if bucket is not None:
+            bucket.observe(resp.status_code, resp.headers)
+        if resp.status_code not in RETRY_STATUSES or attempt >= MAX_RETRIES:
+            return resp
+        retry_after = resp.headers.get("Retry-After")
+        resp.close()
+        log.debug("GET %s -> %d; retrying", url, resp.status_code)
+        time.sleep(retry_delay(attempt, retry_after))
+        attempt += 1
+
+
+async def fetch_page(
+    session: aiohttp.ClientSession,
+    url: str,
+    *,
+    bucket: Optional[TokenBucket] = None,
+    max_retries: int = MAX_RETRIES,
+    etag: Optional[str] = None,
+) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Fetches a single OData page and returns (payload, ETag); payload is None on 304.
+    Each attempt takes a token from `bucket`; 429/5xx and connection errors are retried.
+    """
+    headers = {"If-None-Match": etag} if etag else None
+    attempt = 0
+    while True:
+        retry_after = None
+        if bucket is not None:
+            await bucket.acquire()
+        try:
+            async with session.get(url, headers=headers) as resp:
+                if bucket is not None:
+                    bucket.observe(resp.status, resp.headers)
+                if resp.status == 200:
+                    log.debug(
+                        "GET %s -> 200 (Content-Encoding: %s)", url, resp.headers.get("Content-Encoding", "identity")
+                    )
+                    return orjson.loads(await resp.read()), resp.headers.get("ETag")
+                if resp.status == 304 and etag:
+                    log.debug("GET %s -> 304", url)
+                    return None, etag
+                if resp.status not in RETRY_STATUSES or attempt >= max_retries:
+                    raise WHOAPIError(resp.status, await resp.text())
+                retry_after = resp.headers.get("Retry-After")
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            if attempt >= max_retries:
+                raise
+        await asyncio.sleep(retry_delay(attempt, retry_after))
+        attempt += 1
+
+
+async def iter_pages_async(
+    base_url: str,
+    *,
+    session: aiohttp.ClientSession,
+    page_size: int,
+    max_rows: Optional[int],
+    bucket: Optional[TokenBucket],
+    concurrency: int,
+    probe_page_size: bool = False,
+    cache: Optional[PageCache] = None,
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """
+    Yields pages (lists of records) in offset order, with up to `concurrency`
+    requests in flight and at most 2 * `concurrency` pages fetched ahead.
+    """
+    sem = asyncio.Semaphore(concurrency)
 
-        payload = resp.json()
+    async def fetch_probe(top: int) -> Tuple[List[Dict[str, Any]], Optional[Any]]:
+        # Returns (rows, @odata.count); a 304 replays both from the cache.
+        url = page_url(base_url, skip=0, top=top, count=True)
+        etag = cache.etag(url) if cache is not None else None
+        async with sem:
+            payload, etag = await fetch_page(session, url, bucket=bucket, etag=etag)
+        if payload is None:
+            return cache.replay(url, 0), cache.count(url)
         rows = payload.get("value", [])
-        if not rows:
+        if cache is not None:
+            cache.store(url, etag, len(rows), payload.get("@odata.count"))
+        return rows, payload.get("@odata.count")
+
+    async def fetch_rows(skip: int, top: int) -> Optional[List[Dict[str, Any]]]:
+        # None means 304 Not Modified; see resolve().
+        url = page_url(base_url, skip=skip, top=top)
+        etag = cache.etag(url) if cache is not None else None
+        async with sem:
+            payload, etag = await fetch_page(session, url, bucket=bucket, etag=etag)
+        if payload is None:
+            return None
+        rows = payload.get("value", [])
+        if cache is not None:
+            cache.store(url, etag, len(rows))
+        return rows
+
+    def resolve(skip: int, top: int, rows: Optional[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        if rows is None:
+            # Replay must run in offset order, so it happens here rather than in fetch_rows.
+            return cache.replay(page_url(base_url, skip=skip, top=top), skip)
+        return rows
+
+    def plan(start: int, stop: int) -> List[Tuple[int, int]]:
+        return [(skip, min(page_size, stop - skip)) for skip in range(start, stop, page_size)]
+
+    first_top = PROBE_START_PAGE_SIZE if probe_page_size else page_size
+    if max_rows is not None:
+        first_top = min(first_top, max_rows)
+    if first_top <= 0:
+        return
+    while first_top > page_size:
+        try:
+            rows, total = await fetch_probe(first_top)
+            break
+        except WHOAPIError as exc:
+            if exc.status not in PAGE_SIZE_REJECTED_STATUSES:
+                raise
+            log.info("Page size %d rejected (HTTP %d); halving", first_top, exc.status)
+            first_top = max(first_top // 2, page_size)
+    else:
+        rows, total = await fetch_probe(first_top)
+    page_size = first_top
+
+    if rows:
+        yield rows
+
+    stop = max_rows
+    if total is not None:
+        stop = int(total) if max_rows is None else min(int(total), max_rows)
+    if len(rows) < first_top:
+        # Short probe: either the end, or the server caps $top below what we asked.
+        if not rows or (stop is not None and stop <= len(rows)):
             return
+        if total is not None:
+            log.warning("WHO API returned %d rows for $top=%d; using it as the page size", len(rows), first_top)
+        page_size = len(rows)
 
-        for r in rows:
-            yield r
-        fetched += len(rows)
-        skip += len(rows)
+    if stop is not None:
+        # Offsets are fetched concurrently but yielded in offset order.
+        offsets = iter(plan(len(rows), stop))
+        window: "collections.deque[Tuple[int, int, asyncio.Task[Any]]]" = collections.deque()
+
+        def launch() -> None:
+            nxt = next(offsets, None)
+            if nxt is not None:
+                skip, top = nxt
+                window.append((skip, top, asyncio.create_task(fetch_rows(skip, top))))
+
+        try:
+            for _ in range(2 * concurrency):
+                launch()
+            while window:
+                skip, top, task = window.popleft()
+                rows = resolve(skip, top, await task)
+                launch()
+                if rows:
+                    yield rows
+        finally:
+            for _, _, task in window:
+                task.cancel()
+        return
+
+    skip = len(rows)
+    while True:
+        wave = plan(skip, skip + page_size * concurrency)
+        pages = await asyncio.gather(*[fetch_rows(s, top) for s, top in wave])
+        for (s, top), page in zip(wave, pages):
+            rows = resolve(s, top, page)
+            if rows:
+                yield rows
+            if len(rows) < page_size:
+                return
+        skip = wave[-1][0] + page_size
+
+
+def _drain(pages: "asyncio.Queue[Any]", loop: asyncio.AbstractEventLoop) -> Iterator[Dict[str, Any]]:
+    """
+    Blocking iterator over rows put on `pages` by the event loop; runs on the writer thread.
+    """
+    while True:
+        page = asyncio.run_coroutine_threadsafe(pages.get(), loop).result()
+        if page is _DONE:
+            return
+        if page is _ABORT:
+            raise RuntimeError("WHO API fetch aborted")
+        yield from page
+
+
+def _abort(pages: "asyncio.Queue[Any]") -> None:
+    """
+    Puts _ABORT on `pages` without waiting; queued pages are dropped to make
+    room, since the writer discards everything after an abort anyway.
+    """
+    while True:
+        try:
+            pages.put_nowait(_ABORT)
+            return
+        except asyncio.QueueFull:
+            pages.get_nowait()
 
-        if sleep_s > 0:
-            time.sleep(sleep_s)
+
+async def ingest_async(
+    base_url: str,
+    *,
+    writer: Callable[[Iterable[Dict[str, Any]]], int],
+    headers: Dict[str, str],
+    page_size: int,
+    max_rows: Optional[int],
+    rps: float,
+    burst: int,
+    timeout_s: int,
+    concurrency: int,
+    probe_page_size: bool = False,
+    cache: Optional[PageCache] = None,
+) -> int:
+    """
+    Fetches pages concurrently and streams them through an asyncio.Queue into
+    `writer`, which runs on a worker thread so file/Snowflake writes overlap fetches.
+    Returns whatever `writer` returns (number of rows written).
+    """
+    loop = asyncio.get_running_loop()
+    bucket = TokenBucket(rps, burst) if rps > 0 else None
+    pages: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=concurrency * 2)
+
+    timeout = aiohttp.ClientTimeout(total=timeout_s)
+    connector = aiohttp.TCPConnector(limit=concurrency, ttl_dns_cache=300)
+    async with aiohttp.ClientSession(headers=headers, timeout=timeout, connector=connector) as session:
+
+        async def produce() -> None:
+            try:
+                async for rows in iter_pages_async(
+                    base_url,
+                    session=session,
+                    page_size=page_size,
+                    max_rows=max_rows,
+                    bucket=bucket,
+                    concurrency=concurrency,
+                    probe_page_size=probe_page_size,
+                    cache=cache,
+                ):
+                    await pages.put(rows)
+            except BaseException:
+                _abort(pages)
+                raise
+            finally:
+                if cache is not None:
+                    cache.close()
+            await pages.put(_DONE)
+
+        produce_task = asyncio.create_task(produce())
+        try:
+            n = await asyncio.to_thread(writer, _drain(pages, loop))
+        except BaseException:
+            # Nothing drains `pages` any more, so stop the producer rather than
+            # let it block on a full queue. If the fetch failed first, that
+            # error (not the writer's "fetch aborted") is the one raised.
+            produce_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await produce_task
+            raise
+        await produce_task
+    return n
 
 
 def ensure_dir(p: Path) -> None:
     p.mkdir(parents=True, exist_ok=True)
 
 
+def _part_path(path: Path) -> Path:
+    return path.with_name(path.name + ".part")
+
+
+def write_bytes_atomic(path: Path, data: bytes) -> None:
+    """
+    Writes `data` in one call to a .part file, then renames it over `path`.
+    """
+    part = _part_path(path)
+    part.write_bytes(data)
+    os.replace(part, path)
+
+
+class JsonlWriter:
+    """
+    Buffered gzipped JSONL writer; output only replaces `path` on a clean exit.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._part = _part_path(path)
+        self._buf = bytearray()
+        self._f = gzip.open(self._part, "wb", compresslevel=JSONL_GZIP_LEVEL)
+
+    def write(self, data: bytes) -> None:
+        self._buf += data
+        if len(self._buf) >= FLUSH_BYTES:
+            self._f.write(self._buf)
+            self._buf.clear()
+
+    def __enter__(self) -> "JsonlWriter":
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        try:
+            if exc_type is None:
+                self._f.write(self._buf)
+            self._f.close()
+        except BaseException:
+            self._part.unlink(missing_ok=True)
+            raise
+        if exc_type is None:
+            os.replace(self._part, self.path)
+        else:
+            self._part.unlink(missing_ok=True)
+
+
+class PageCache:
+    """
+    Per-page ETags from today's previous run (`_pages.json`), and in-order
+    replay of 304 Not Modified pages from that run's JSONL.
+    """
+
+    def __init__(self, pages_file: Path, previous_jsonl: Path, *, reuse: bool = True) -> None:
+        self.pages_file = pages_file
+        self.previous_jsonl = previous_jsonl
+        self._old: Dict[str, Dict[str, Any]] = {}
+        if reuse and pages_file.exists() and previous_jsonl.exists():
+            self._old = json.loads(pages_file.read_text(encoding="utf-8")).get("pages", {})
+        self._new: Dict[str, Dict[str, Any]] = {}
+        self._reader: Optional[Any] = None
+        self._line = 0
+
+    def etag(self, url: str) -> Optional[str]:
+        return self._old.get(url, {}).get("etag")
+
+    def count(self, url: str) -> Optional[int]:
+        # @odata.count saved with a $count=true page.
+        return self._old.get(url, {}).get("count")
+
+    def store(self, url: str, etag: Optional[str], rows: int, count: Optional[int] = None) -> None:
+        if etag:
+            self._new[url] = {"etag": etag, "rows": rows}
+            if count is not None:
+                self._new[url]["count"] = count
+
+    def replay(self, url: str, skip: int) -> List[Dict[str, Any]]:
+        entry = self._old[url]
+        if self._reader is None:
+            self._reader = gzip.open(self.previous_jsonl, "rb")
+        if skip < self._line:
+            raise RuntimeError(f"Page cache replayed out of order at $skip={skip}")
+        while self._line < skip:
+            self._reader.readline()
+            self._line += 1
+        rows = []
+        for _ in range(entry["rows"]):
+            line = self._reader.readline()
+            if not line:
+                raise RuntimeError(f"{self.previous_jsonl} is shorter than {self.pages_file} says; rerun with --force")
+            rows.append(orjson.loads(line))
+        self._line += len(rows)
+        self.store(url, entry["etag"], len(rows), entry.get("count"))
+        return rows
+
+    def close(self) -> None:
+        # Must happen before the new JSONL replaces the file being read.
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+
+    def save(self) -> None:
+        write_bytes_atomic(self.pages_file, json.dumps({"pages": self._new}, indent=2).encode("utf-8"))
+
+
 def write_jsonl(path: Path, rows: Iterable[Dict[str, Any]]) -> int:
     """
-    Writes rows to a JSONL file. Returns number of rows written.
+    Writes rows to a gzipped JSONL file. Returns number of rows written.
     """
     n = 0
-    with path.open("w", encoding="utf-8") as f:
+    with JsonlWriter(path) as f:
         for r in rows:
-            f.write(json.dumps(r, ensure_ascii=False))
-            f.write("\n")
+            f.write(orjson.dumps(r, option=orjson.OPT_APPEND_NEWLINE))
             n += 1
     return n
 
@@ -166,7 +761,12 @@ def get_snowflake_config() -> Dict[str, str]:
 
 
 def connect_to_snowflake(config: Dict[str, str]):
-    return snowflake.connector.connect(**config)
+    # qmark binds server-side, so repeated INSERT text is prepared once;
+    # keep-alive stops long ingests from losing the session token.
+    # Imported here: the connector (which pulls in pandas) is only needed with --snowflake.
+    import snowflake.connector
+
+    return snowflake.connector.connect(paramstyle="qmark", client_session_keep_alive=True, **config)
 
 
 def ensure_snowflake_table(cursor: snowflake.connector.cursor.SnowflakeCursor, table_name: str) -> None:
@@ -182,56 +782,419 @@ def ensure_snowflake_table(cursor: snowflake.connector.cursor.SnowflakeCursor, t
     )
 
 
+def _sql_literal(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def table_stage(table_name: str) -> str:
+    """
+    Table stage for `table_name`: @%t, or @db.schema.%t for qualified names.
+    """
+    namespace, _, name = table_name.rpartition(".")
+    return f"@{namespace}.%{name}" if namespace else f"@%{name}"
+
+
+def _timestamp_fields_as_strings(schema: pa.Schema) -> List[pa.Field]:
+    """
+    The fields of `schema` that contain timestamps, retyped to hold strings instead.
+    """
+    def convert(t: pa.DataType) -> pa.DataType:
+        if pa.types.is_timestamp(t):
+            return pa.string()
+        if pa.types.is_struct(t):
+            return pa.struct([f.with_type(convert(f.type)) for f in t])
+        if pa.types.is_list(t):
+            return pa.list_(convert(t.value_type))
+        return t
+
+    return [f.with_type(convert(f.type)) for f in schema if convert(f.type) != f.type]
+
+
+def _read_json_keep_strings(path: Path) -> pa.Table:
+    """
+    Reads JSONL with Arrow, except that ISO date-time strings stay strings.
+    """
+    # Only timestamp fields are pinned; everything else is still inferred over the whole file.
+    pinned = _timestamp_fields_as_strings(pa_json.open_json(path).schema)
+    while True:
+        table = pa_json.read_json(path, parse_options=pa_json.ParseOptions(explicit_schema=pa.schema(pinned)))
+        later = _timestamp_fields_as_strings(table.schema)
+        if not later:
+            return table
+        pinned += later
+
+
+def jsonl_to_parquet(path: Path) -> Path:
+    """
+    Converts a gzipped JSONL file to a zstd Parquet file next to it; the JSONL
+    stays as the raw archive. Raises pyarrow.ArrowInvalid if the file is empty
+    or a column changes type between rows.
+    """
+    parquet_path = path.parent / (path.name.split(".", 1)[0] + ".parquet")
+    table = _read_json_keep_strings(path)
+    pq.write_table(table, parquet_path, compression="zstd", use_dictionary=True)
+    return parquet_path
+
+
+def copy_file_into_snowflake(
+    cursor: snowflake.connector.cursor.SnowflakeCursor,
+    path: Path,
+    *,
+    file_format: str,
+    table_name: str,
+    indicator: str,
+    ingest_date: str,
+) -> None:
+    """
+    Bulk loads a local gzipped JSONL or Parquet file: PUT it under a unique
+    table-stage directory, then one COPY INTO that purges it.
+    """
+    stage = f"{table_stage(table_name)}/{indicator}/{ingest_date}/{uuid.uuid4().hex}"
+    cursor.execute(f"PUT 'file://{path.resolve().as_posix()}' {stage}/ AUTO_COMPRESS=FALSE")
+    cursor.execute(
+        f"""
+        COPY INTO {table_name} (indicator, ingest_date, id, data)
+        FROM (
+            SELECT {_sql_literal(indicator)}, {_sql_literal(ingest_date)}, $1:Id::string, $1
+            FROM {stage}/{path.name}
+        )
+        FILE_FORMAT = ({STAGE_FILE_FORMATS[file_format]})
+        ON_ERROR = 'ABORT_STATEMENT'
+        PURGE = TRUE
+        """
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _insert_sql(table_name: str, n_rows: int) -> str:
+    placeholders = ", ".join(["(?, ?, ?, ?)"] * n_rows)
+    return (
+        f"INSERT INTO {table_name} (indicator, ingest_date, id, data) "
+        f"SELECT column1, column2, column3, parse_json(column4) FROM VALUES {placeholders}"
+    )
+
+
+def insert_rows_into_snowflake(
+    cursor: snowflake.connector.cursor.SnowflakeCursor,
+    table_name: str,
+    batch: List[Tuple[str, str, Any, str]],
+) -> None:
+    """
+    Inserts a batch with one multi-row INSERT ... SELECT FROM VALUES per chunk.
+    """
+    rows_per_statement = SNOWFLAKE_MAX_BIND_PARAMS // 4
+    for start in range(0, len(batch), rows_per_statement):
+        chunk = batch[start : start + rows_per_statement]
+        params = [value for row in chunk for value in row]
+        cursor.execute(_insert_sql(table_name, len(chunk)), params)
+
+
+def pandas_staging_table(table_name: str) -> str:
+    return f"{table_name}_pandas_staging"
+
+
+def ensure_pandas_staging_table(cursor: snowflake.connector.cursor.SnowflakeCursor, table_name: str) -> None:
+    """
+    Creates the session-scoped table write_pandas loads into. `data` stays a
+    string there (write_pandas cannot produce VARIANT); it is parsed on the copy over.
+    """
+    cursor.execute(
+        f"""
+        CREATE TEMPORARY TABLE IF NOT EXISTS {pandas_staging_table(table_name)} (
+            indicator STRING,
+            ingest_date STRING,
+            id STRING,
+            data STRING
+        )
+        """
+    )
+
+
+def write_pandas_into_snowflake(
+    conn: snowflake.connector.SnowflakeConnection,
+    cursor: snowflake.connector.cursor.SnowflakeCursor,
+    table_name: str,
+    batch: List[Tuple[str, str, Any, str]],
+) -> None:
+    """
+    Loads a batch with write_pandas (Parquet files PUT in parallel, then one COPY)
+    into the staging table, then moves it into `table_name` with parse_json in a
+    single INSERT ... SELECT and empties the staging table for the next batch.
+    """
+    import pandas as pd
+    from snowflake.connector.pandas_tools import write_pandas
+
+    if not batch:
+        return
+    staging = pandas_staging_table(table_name)
+    df = pd.DataFrame(
+        {
+            "indicator": [row[0] for row in batch],
+            "ingest_date": [row[1] for row in batch],
+            "id": [None if row[2] is None else str(row[2]) for row in batch],
+            "data": [row[3] for row in batch],
+        }
+    )
+    success, _, _, _ = write_pandas(
+        conn,
+        df,
+        staging,
+        chunk_size=PANDAS_FILE_ROWS,
+        parallel=PANDAS_PUT_PARALLEL,
+        compression="gzip",
+        quote_identifiers=False,
+        use_logical_type=True,
+    )
+    if not success:
+        raise RuntimeError(f"write_pandas failed loading {len(batch)} rows into {staging}")
+    cursor.execute(
+        f"""
+        INSERT INTO {table_name} (indicator, ingest_date, id, data)
+        SELECT indicator, ingest_date::date, id, parse_json(data)
+        FROM {staging}
+        """
+    )
+    cursor.execute(f"TRUNCATE TABLE {staging}")
+
+
+def _close_connection(conn_future: "Future[Any]") -> None:
+    if not conn_future.cancelled() and conn_future.exception() is None:
+        conn_future.result().close()
+
+
+def snowflake_writer(
+    batches: "queue.Queue[Optional[List[Tuple[str, str, Any, str]]]]",
+    conn_future: "Future[Any]",
+    table_name: str,
+    errors: List[BaseException],
+    load: str = "insert",
+) -> None:
+    """
+    Loads batches from `batches` on its own thread until the None sentinel;
+    after a failure it keeps draining so the producer never blocks.
+    """
+    conn = cursor = None
+    while True:
+        batch = batches.get()
+        if batch is None:
+            return
+        if errors:
+            continue
+        try:
+            if cursor is None:
+                conn = conn_future.result()
+                cursor = conn.cursor()
+                ensure_snowflake_table(cursor, table_name)
+                if load == "pandas":
+                    ensure_pandas_staging_table(cursor, table_name)
+            if load == "pandas":
+                write_pandas_into_snowflake(conn, cursor, table_name, batch)
+            else:
+                insert_rows_into_snowflake(cursor, table_name, batch)
+        except BaseException as exc:
+            errors.append(exc)
+
+
 def write_jsonl_and_snowflake(
     path: Path,
     rows: Iterable[Dict[str, Any]],
     *,
+    conn_future: "Future[Any]",
     table_name: str,
     indicator: str,
     ingest_date: str,
+    load: str,
+    stage_format: str,
     batch_size: int,
 ) -> int:
-    config = get_snowflake_config()
-    conn = connect_to_snowflake(config)
+    """
+    Writes rows to a gzipped JSONL file and loads them into Snowflake. Returns number of rows written.
+    """
     try:
-        cursor = conn.cursor()
-        ensure_snowflake_table(cursor, table_name)
-
-        n = 0
-        batch = []
-        with path.open("w", encoding="utf-8") as f:
-            for row in rows:
-                payload = json.dumps(row, ensure_ascii=False)
-                f.write(payload)
-                f.write("\n")
-                batch.append((indicator, ingest_date, row.get("Id"), payload))
-                n += 1
-
-                if len(batch) >= batch_size:
-                    cursor.executemany(
-                        f"INSERT INTO {table_name} (indicator, ingest_date, id, data) "
-                        "SELECT %s, %s, %s, parse_json(%s)",
-                        batch,
-                    )
-                    batch.clear()
+        if load == "copy":
+            n = write_jsonl(path, rows)
+            staged, file_format = path, "jsonl"
+            if stage_format == "parquet":
+                try:
+                    staged, file_format = jsonl_to_parquet(path), "parquet"
+                except pa.ArrowInvalid as exc:
+                    log.warning("Parquet conversion skipped (%s); staging JSONL instead.", exc)
 
-        if batch:
-            cursor.executemany(
-                f"INSERT INTO {table_name} (indicator, ingest_date, id, data) "
-                "SELECT %s, %s, %s, parse_json(%s)",
-                batch,
+            cursor = conn_future.result().cursor()
+            ensure_snowflake_table(cursor, table_name)
+            copy_file_into_snowflake(
+                cursor,
+                staged,
+                file_format=file_format,
+                table_name=table_name,
+                indicator=indicator,
+                ingest_date=ingest_date,
+            )
+        else:
+            n = 0
+            batch = []
+            if load == "pandas":
+                batch_size, queue_size = PANDAS_CHUNK_ROWS, 1
+            else:
+                queue_size = SNOWFLAKE_WRITER_QUEUE_SIZE
+            batches: "queue.Queue[Optional[List[Tuple[str, str, Any, str]]]]" = queue.Queue(maxsize=queue_size)
+            errors: List[BaseException] = []
+            writer = threading.Thread(
+                target=snowflake_writer,
+                args=(batches, conn_future, table_name, errors, load),
+                name="snowflake-writer",
+                daemon=True,
             )
+            writer.start()
+            try:
+                with JsonlWriter(path) as f:
+                    for row in rows:
+                        payload = orjson.dumps(row, option=orjson.OPT_APPEND_NEWLINE)
+                        f.write(payload)
+                        # One encode per row: the file bytes are also the parse_json bind
+                        # (which ignores the trailing newline).
+                        batch.append((indicator, ingest_date, row.get("Id"), payload.decode()))
+                        n += 1
+
+                        if len(batch) >= batch_size:
+                            batches.put(batch)
+                            batch = []
+                            if errors:
+                                # Raised inside the block so JsonlWriter drops the partial file.
+                                raise errors[0]
+
+                # Always hand over the tail, even if empty, so the table gets created.
+                if not errors:
+                    batches.put(batch)
+            finally:
+                batches.put(None)
+                writer.join()
 
-        conn.commit()
+            if errors:
+                raise errors[0]
+
+        conn_future.result().commit()
         return n
     finally:
-        conn.close()
+        # Also covers a connect still in flight when fetching failed.
+        conn_future.add_done_callback(_close_connection)
+
+
+def configure_logging(verbose: bool) -> None:
+    logging.basicConfig(
+        level=logging.DEBUG if verbose else logging.WARNING,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+
+
+def _ingest_one(indicator: str, args: argparse.Namespace) -> int:
+    """
+    Ingests one indicator end to end (fetch, JSONL, optional Snowflake load).
+    Runs in the main process, or in a pool worker when several indicators are given.
+    Returns number of rows written.
+    """
+    configure_logging(args.verbose)  # no-op unless this is a fresh (spawned) worker
+    root = project_root_from_this_file()
+    ingest_date = utc_today_str()
+
+    out_dir = root / "data" / "raw" / "who" / indicator / f"ingest_date={ingest_date}"
+    ensure_dir(out_dir)
+
+    out_file = out_dir / "part-00000.jsonl.gz"
+
+    meta = {
+        "indicator": indicator,
+        "ingest_date": ingest_date,
+        "page_size": args.page_size,
+        "max_page_size_probe": args.max_page_size_probe,
+        "max_rows": args.top,
+        "select": args.select,
+        "filter": args.filters,
+        "timestamp_utc": datetime.now(timezone.utc).isoformat(),
+    }
+    meta_file = out_dir / "_meta.json"
+    write_bytes_atomic(meta_file, json.dumps(meta, indent=2).encode("utf-8"))
+    cache = PageCache(out_dir / "_pages.json", out_file, reuse=not args.force)
+
+    headers = {
+        "User-Agent": "KarimJebara-WHO-ETL/1.0 (+local project)",
+        "Accept": "application/json",
+        "Accept-Encoding": ACCEPT_ENCODING,
+        "Connection": "keep-alive",
+    }
+
+    if args.snowflake:
+        # Connect (auth + session) in the background while the first WHO pages download.
+        connect_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="snowflake-connect")
+        conn_future = connect_pool.submit(connect_to_snowflake, get_snowflake_config())
+        connect_pool.shutdown(wait=False)
+
+        table_name = args.snowflake_table or f"who_{indicator.lower()}"
+        writer = functools.partial(
+            write_jsonl_and_snowflake,
+            out_file,
+            conn_future=conn_future,
+            table_name=table_name,
+            indicator=indicator,
+            ingest_date=ingest_date,
+            load=args.snowflake_load,
+            stage_format=args.snowflake_stage_format,
+            batch_size=args.snowflake_batch_size,
+        )
+    else:
+        writer = functools.partial(write_jsonl, out_file)
+
+    base_url = build_base_url(indicator, select=args.select, filters=args.filters)
+    if args.concurrency > 1:
+        n = asyncio.run(
+            ingest_async(
+                base_url,
+                writer=writer,
+                headers=headers,
+                page_size=args.page_size,
+                max_rows=args.top,
+                rps=args.rps,
+                burst=args.burst,
+                timeout_s=args.timeout,
+                concurrency=args.concurrency,
+                probe_page_size=args.max_page_size_probe,
+                cache=cache,
+            )
+        )
+    else:
+        with build_http_session(headers, pool_maxsize=args.concurrency) as s:
+            rows_iter = iter_pages(
+                base_url,
+                session=s,
+                page_size=args.page_size,
+                max_rows=args.top,
+                bucket=TokenBucket(args.rps, args.burst) if args.rps > 0 else None,
+                timeout_s=args.timeout,
+                cache=cache,
+            )
+            n = writer(rows_iter)
+    cache.save()
+    if args.snowflake:
+        print(f"Snowflake load complete: {table_name}")
+
+    print(f"Wrote {n} rows to: {out_file}")
+    print(f"Meta: {meta_file}")
+    return n
 
 
 def main() -> int:
-    parser = argparse.ArgumentParser(description="Ingest WHO GHO API indicator data to raw JSONL.")
-    parser.add_argument("--indicator", required=True, help="Indicator code / endpoint (e.g., MDG_0000000007)")
-    parser.add_argument("--page-size", type=int, default=1000, help="Rows per page ($top). Default 1000.")
+    parser = argparse.ArgumentParser(description="Ingest WHO GHO API indicator data to raw gzipped JSONL.")
+    parser.add_argument(
+        "--indicator",
+        required=True,
+        help="Indicator code / endpoint (e.g., MDG_0000000007); comma-separate several to ingest them in parallel.",
+    )
+    parser.add_argument("--page-size", type=int, default=5000, help="Rows per page ($top). Default 5000.")
+    parser.add_argument(
+        "--max-page-size-probe",
+        action="store_true",
+        help=f"Start at $top={PROBE_START_PAGE_SIZE} and halve until the WHO API accepts it (min --page-size).",
+    )
     parser.add_argument("--top", type=int, default=None, help="Max total rows to fetch (for testing).")
     parser.add_argument(
         "--select",
@@ -246,80 +1209,111 @@ def main() -> int:
         default=None,
         help='OData $filter string (optional). Example: SpatialDimType eq \'COUNTRY\'',
     )
-    parser.add_argument("--sleep", type=float, default=0.0, help="Seconds to sleep between pages (polite).")
+    parser.add_argument(
+        "--rps",
+        type=float,
+        default=10.0,
+        help=(
+            "Max WHO API requests per second, shared by all indicators; halves on 429 and "
+            "recovers gradually. 0 disables. Default 10."
+        ),
+    )
+    parser.add_argument("--burst", type=int, default=20, help="Requests allowed in a burst above --rps. Default 20.")
     parser.add_argument("--timeout", type=int, default=30, help="HTTP timeout seconds. Default 30.")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help=(
+            "Max WHO API page requests in flight, shared by all indicators. "
+            "Default 8; 1 fetches pages serially (and one indicator at a time)."
+        ),
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-download every page, ignoring ETags saved by an earlier run today.",
+    )
+    parser.add_argument("--verbose", action="store_true", help="Log each WHO API request (debug level).")
     parser.add_argument("--snowflake", action="store_true", help="Also load rows into Snowflake.")
     parser.add_argument(
         "--snowflake-table",
         default=None,
         help="Snowflake table name (default: who_<indicator>).",
     )
+    parser.add_argument(
+        "--snowflake-load",
+        choices=SNOWFLAKE_LOAD_METHODS,
+        default="copy",
+        help=(
+            "Snowflake load method: copy (PUT + COPY INTO, default), insert (multi-row INSERT) "
+            "or pandas (write_pandas bulk loads while fetching)."
+        ),
+    )
+    parser.add_argument(
+        "--snowflake-stage-format",
+        choices=tuple(STAGE_FILE_FORMATS),
+        default="parquet",
+        help="File staged for --snowflake-load copy: parquet (default) or the gzipped jsonl.",
+    )
     parser.add_argument(
         "--snowflake-batch-size",
         type=int,
         default=1000,
-        help="Snowflake insert batch size. Default 1000.",
+        help="Rows per INSERT batch for --snowflake-load insert. Default 1000.",
     )
 
     args = parser.parse_args()
-    load_dotenv()
+    configure_logging(args.verbose)
+    load_dotenv(override=False)
 
     if args.snowflake_batch_size <= 0:
         raise SystemExit("--snowflake-batch-size must be > 0")
+    if args.rps < 0:
+        raise SystemExit("--rps must be >= 0")
+    if args.burst <= 0:
+        raise SystemExit("--burst must be > 0")
+    if args.concurrency <= 0:
+        raise SystemExit("--concurrency must be > 0")
+    if args.max_page_size_probe and args.concurrency == 1:
+        raise SystemExit("--max-page-size-probe requires --concurrency > 1")
 
-    root = project_root_from_this_file()
-    ingest_date = utc_today_str()
-
-    out_dir = root / "data" / "raw" / "who" / args.indicator / f"ingest_date={ingest_date}"
-    ensure_dir(out_dir)
-
-    out_file = out_dir / "part-00000.jsonl"
+    indicators = [code.strip() for code in args.indicator.split(",") if code.strip()]
+    if not indicators:
+        raise SystemExit("--indicator must name at least one indicator")
+    if len(indicators) == 1:
+        _ingest_one(indicators[0], args)
+        return 0
 
-    meta = {
-        "indicator": args.indicator,
-        "ingest_date": ingest_date,
-        "page_size": args.page_size,
-        "max_rows": args.top,
-        "select": args.select,
-        "filter": args.filters,
-        "timestamp_utc": datetime.now(timezone.utc).isoformat(),
-    }
-    meta_file = out_dir / "_meta.json"
-    meta_file.write_text(json.dumps(meta, indent=2), encoding="utf-8")
-
-    headers = {
-        "User-Agent": "KarimJebara-WHO-ETL/1.0 (+local project)",
-        "Accept": "application/json",
-    }
-
-    with requests.Session() as s:
-        s.headers.update(headers)
-        rows_iter = iter_pages(
-            args.indicator,
-            session=s,
-            page_size=args.page_size,
-            max_rows=args.top,
-            select=args.select,
-            filters=args.filters,
-            sleep_s=args.sleep,
-            timeout_s=args.timeout,
-        )
-        if args.snowflake:
-            table_name = args.snowflake_table or f"who_{args.indicator.lower()}"
-            n = write_jsonl_and_snowflake(
-                out_file,
-                rows_iter,
-                table_name=table_name,
-                indicator=args.indicator,
-                ingest_date=ingest_date,
-                batch_size=args.snowflake_batch_size,
-            )
-            print(f"Snowflake load complete: {table_name}")
-        else:
-            n = write_jsonl(out_file, rows_iter)
+    # Indicators are independent, so each gets its own process (own event
+    # loop, HTTP session and Snowflake connection); nothing is shared except
+    # the WHO API budget, which is split evenly between concurrent workers.
+    failed = []
+    workers = min(len(indicators), os.cpu_count() or 1)
+    if args.concurrency > 1:
+        workers = min(workers, args.concurrency // 2)  # keep every worker on the concurrent path
+    else:
+        workers = 1
+    worker_args = argparse.Namespace(
+        **{
+            **vars(args),
+            "concurrency": args.concurrency // workers,
+            "rps": args.rps / workers,
+            "burst": max(1, args.burst // workers),
+        }
+    )
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(_ingest_one, indicator, worker_args): indicator for indicator in indicators}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as exc:
+                failed.append(futures[future])
+                print(f"{futures[future]} failed: {exc}", file=sys.stderr)
 
-    print(f"Wrote {n} rows to: {out_file}")
-    print(f"Meta: {meta_file}")
+    if failed:
+        print("Failed indicators: " + ", ".join(sorted(failed)), file=sys.stderr)
+        return 1
     return 0
 
 